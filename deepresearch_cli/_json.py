@@ -0,0 +1,33 @@
+"""JSON helpers that use orjson when it is installed (``performance`` extra)."""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON.
+
+    Without ``indent`` the output is compact and identical with or without
+    orjson, so hashes of it (cache keys) don't depend on what is installed.
+    """
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        ensure_ascii=False
+    ).encode("utf-8")
+
+
+def loads(data):
+    """Parse JSON from ``str`` or ``bytes``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
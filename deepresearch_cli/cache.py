@@ -0,0 +1,193 @@
+"""
+Response cache for Deep Research results.
+
+Research calls take minutes and cost real money, so completed results are
+kept and reused. Lookups are exact first (a hash of the model, input and
+tools) and, optionally, semantic: a query whose embedding is close enough to
+a stored one, with the same model and research options, reuses that entry's
+result.
+"""
+
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, Optional, Protocol
+
+from ._json import dumps, loads
+
+
+# Results are reused for a day; research goes stale quickly
+DEFAULT_TTL = 24 * 3600
+
+# Minimum cosine similarity for a semantic cache hit
+DEFAULT_SIMILARITY = 0.92
+
+# Model used to embed queries for semantic lookups
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+
+class CacheBackend(Protocol):
+    """Storage for cache entries, which are JSON-serializable dicts."""
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the live entry stored under ``key``, if any."""
+
+    def set(self, key: str, value: dict, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+
+    def items(self) -> Iterator[tuple[str, dict]]:
+        """Iterate over every live (key, entry) pair."""
+
+
+class MemoryBackend:
+    """In-process backend for hosts that keep one process alive."""
+
+    def __init__(self):
+        self._entries: dict[str, tuple[float, dict]] = {}
+
+    def get(self, key: str) -> Optional[dict]:
+        expires, value = self._entries.get(key, (0.0, None))
+        return value if expires > time.time() else None
+
+    def set(self, key: str, value: dict, ttl: float) -> None:
+        self._entries[key] = (time.time() + ttl, value)
+
+    def items(self) -> Iterator[tuple[str, dict]]:
+        now = time.time()
+        for key, (expires, value) in list(self._entries.items()):
+            if expires > now:
+                yield key, value
+            else:
+                del self._entries[key]
+
+
+class SQLiteBackend:
+    """File backend storing entries in a SQLite database.
+
+    Expired entries are deleted when the database is first opened, so full
+    scans (semantic lookups) only ever read roughly one TTL's worth of rows.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS entries "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+                )
+                conn.execute("DELETE FROM entries WHERE expires <= ?", (time.time(),))
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM entries WHERE key = ? AND expires > ?",
+                (key, time.time())
+            ).fetchone()
+        return loads(row[0]) if row else None
+
+    def set(self, key: str, value: dict, ttl: float) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, expires) VALUES (?, ?, ?)",
+                    (key, dumps(value).decode("utf-8"), time.time() + ttl)
+                )
+
+    def items(self) -> Iterator[tuple[str, dict]]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT key, value FROM entries WHERE expires > ?", (time.time(),)
+            ).fetchall()
+        for key, value in rows:
+            yield key, loads(value)
+
+
+def exact_key(model: str, input_text: str, tools: list[dict]) -> str:
+    """Return the exact-match cache key for a research request."""
+    payload = {"model": model, "input": input_text, "tools": tools}
+    return hashlib.sha256(dumps(payload, sort_keys=True)).hexdigest()
+
+
+def cosine_similarity(a: list[float], b: list[float]) -> float:
+    """Return the cosine similarity of two vectors (0.0 if either is zero)."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class ResponseCache:
+    """Two-tier research result cache on top of a ``CacheBackend``.
+
+    Entries hold the research result, its token usage, the model and, when
+    semantic lookups are used, the embedding of the user's query together
+    with the options (context, focus, format) that must match for reuse.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: float = DEFAULT_TTL,
+        similarity: float = DEFAULT_SIMILARITY
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.similarity = similarity
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the entry stored under the exact ``key``, if any."""
+        return self.backend.get(key)
+
+    def get_similar(
+        self,
+        embedding: list[float],
+        model: str,
+        options: Optional[dict] = None
+    ) -> Optional[dict]:
+        """Return the most similar entry for ``model`` above the threshold.
+
+        Args:
+            embedding: Embedding of the incoming user query
+            model: Research model the entry must have been produced by
+            options: Research options the entry must have been stored with
+
+        Returns:
+            The best matching entry, or None if nothing is similar enough
+        """
+        best, best_score = None, self.similarity
+        for _, entry in self.backend.items():
+            stored = entry.get("embedding")
+            if not stored or entry.get("model") != model or entry.get("options") != options:
+                continue
+            score = cosine_similarity(embedding, stored)
+            if score >= best_score:
+                best, best_score = entry, score
+        return best
+
+    def set(
+        self,
+        key: str,
+        result: str,
+        model: str,
+        usage: Optional[dict] = None,
+        embedding: Optional[list[float]] = None,
+        options: Optional[dict] = None
+    ) -> None:
+        """Store a completed research result under ``key``."""
+        entry = {"result": result, "model": model, "usage": usage}
+        if embedding:
+            entry["embedding"] = embedding
+            entry["options"] = options
+        self.backend.set(key, entry, self.ttl)
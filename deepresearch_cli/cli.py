@@ -8,15 +8,46 @@ comprehensive research and save results to markdown files.
 
 import argparse
 import asyncio
-import json
+import atexit
+import contextvars
+import functools
+import hashlib
+import importlib
+import itertools
 import os
+import queue
+import random
+import sqlite3
 import sys
+import threading
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
-from openai import AsyncOpenAI
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+import aiofiles
+import httpx
+import openai
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+)
 import logging
+from logging.handlers import QueueHandler, QueueListener
+
+from ._json import dumps as _json_dumps, loads as _json_loads
+from .cache import EMBEDDING_MODEL, ResponseCache, SQLiteBackend, exact_key
+
+# HTTP library the OpenAI SDK is built on; transports, timeouts and exception
+# types must come from it. Newer SDKs use the httpx2 fork, which keeps the
+# httpx API and is installed as a dependency of openai rather than of ours.
+if issubclass(DefaultAsyncHttpxClient, httpx.AsyncClient):
+    _http = httpx
+else:
+    _http = importlib.import_module("httpx2")
 
 # Configure logging
 logging.basicConfig(
@@ -28,32 +59,136 @@ logging.basicConfig(
 # Suppress verbose logging from third-party libraries
 logging.getLogger("openai").setLevel(logging.WARNING)
 logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("httpx2").setLevel(logging.WARNING)
 logging.getLogger("httpcore").setLevel(logging.WARNING)
 logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 logger = logging.getLogger("deepresearch-cli")
 
 
+def _import_uvloop():
+    """Return the uvloop module if it is installed (``performance`` extra)."""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop
+
+
+@dataclass(frozen=True, slots=True)
 class DeepResearchConfig:
     """Configuration for Deep Research CLI."""
 
-    def __init__(self):
-        self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        if not self.openai_api_key:
-            logger.error("OPENAI_API_KEY environment variable not set")
-            sys.exit(1)
+    openai_api_key: str
 
+    @classmethod
+    def from_env(cls) -> "DeepResearchConfig":
+        """Read the configuration from the environment."""
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY environment variable not set")
+        return cls(openai_api_key=api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> DeepResearchConfig:
+    """Return the configuration, read from the environment once per process.
+
+    Raises ``ValueError`` if ``OPENAI_API_KEY`` is not set; failures are not
+    cached, so a key set later is picked up.
+    """
+    return DeepResearchConfig.from_env()
+
+
+# OpenAI clients shared across research calls, keyed by API key
+_clients: dict[str, AsyncOpenAI] = {}
+
+# 1 hour timeout for long research calls, but fail fast on unreachable hosts
+_HTTP_TIMEOUT = _http.Timeout(3600.0, connect=10.0)
 
-async def enhance_research_prompt(
-    query: str,
-    context: Optional[str] = None,
-    focus: Optional[str] = None,
-    format_type: Optional[str] = None,
-    client: AsyncOpenAI = None
-) -> str:
-    """Enhance the research prompt using an intermediate model like gpt-5-mini."""
 
-    instructions = """
+def _build_http_client() -> DefaultAsyncHttpxClient:
+    """Build the HTTP client used by the OpenAI SDK.
+
+    HTTP/2 lets concurrent requests and status polls share one connection,
+    the larger keep-alive pool avoids reconnecting between polls, and the
+    transport retries absorb transient connection failures (DNS, TLS).
+    """
+    transport = _http.AsyncHTTPTransport(
+        http2=True,
+        limits=_http.Limits(
+            max_connections=64,
+            max_keepalive_connections=32,
+            keepalive_expiry=60.0
+        ),
+        retries=3
+    )
+    return DefaultAsyncHttpxClient(transport=transport, timeout=_HTTP_TIMEOUT)
+
+
+def _get_async_client(api_key: str) -> AsyncOpenAI:
+    """Return the shared OpenAI client for ``api_key``, creating it on first use.
+
+    Reusing one client keeps its connection pool warm across the submission,
+    the status polls and any further queries run in the same process.
+    """
+    if api_key not in _clients:
+        _clients[api_key] = AsyncOpenAI(
+            api_key=api_key,
+            timeout=_HTTP_TIMEOUT,
+            max_retries=5,
+            http_client=_build_http_client()
+        )
+    return _clients[api_key]
+
+
+def get_client() -> AsyncOpenAI:
+    """Return the shared OpenAI client for the ``OPENAI_API_KEY`` environment variable.
+
+    The client and its connection pool are created on first use and closed by
+    ``_close_clients``. Raises ``ValueError`` if the key is not set.
+    """
+    return _get_async_client(get_config().openai_api_key)
+
+
+async def _close_clients() -> None:
+    """Close and forget every shared OpenAI client."""
+    _pollers.clear()
+    while _clients:
+        _, client = _clients.popitem()
+        await client.close()
+
+
+async def _run_and_close(coro):
+    """Await ``coro`` and close the shared clients before the loop shuts down."""
+    try:
+        return await coro
+    finally:
+        await _close_clients()
+        _stop_file_logging()
+
+
+def _run(coro):
+    """Run ``coro`` to completion on a new event loop, using uvloop if installed."""
+    uvloop = _import_uvloop()
+    if sys.version_info >= (3, 11):
+        loop_factory = uvloop.new_event_loop if uvloop else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(_run_and_close(coro))
+
+    # Python 3.10 has no loop factories, only event loop policies
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(_run_and_close(coro))
+
+
+# Model used to turn a user query into detailed researcher instructions
+_ENHANCE_MODEL = "gpt-5-mini"
+
+# System instructions for the prompt enhancement model
+_ENHANCE_INSTRUCTIONS = """
 You will be given a research task by a user. Your job is to produce a set of
 instructions for a researcher that will complete the task. Do NOT complete the
 task yourself, just provide instructions on how to complete it.
@@ -94,7 +229,89 @@ GUIDELINES:
 - Be analytical and avoid generalities.
 - Request specific figures, trends, statistics, and measurable outcomes.
 - Ensure each section supports data-backed reasoning.
-"""
+""".strip()
+
+# The instructions are a static prefix sent verbatim on every call; a stable
+# cache key routes those calls to the same OpenAI prompt cache
+_ENHANCE_PROMPT_CACHE_KEY = "deepresearch-cli-enhance-" + hashlib.blake2b(
+    _ENHANCE_INSTRUCTIONS.encode("utf-8"), digest_size=8
+).hexdigest()
+
+# Enhanced prompts are cached on disk so re-runs skip the model round-trip
+_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "deepresearch-cli"
+_ENHANCE_CACHE_TTL = 30 * 24 * 3600  # 30 days
+_enhance_cache = SQLiteBackend(_CACHE_DIR / "enhance.sqlite")
+
+
+def _enhancement_key(
+    query: str,
+    context: Optional[str],
+    focus: Optional[str],
+    format_type: Optional[str]
+) -> str:
+    """Return the enhancement cache key for a research request."""
+    return hashlib.blake2b(
+        _json_dumps([query, context, focus, format_type, _ENHANCE_MODEL]),
+        digest_size=16
+    ).hexdigest()
+
+
+def _lookup_enhancement(key: str) -> Optional[str]:
+    """Return the cached enhanced prompt for ``key``, or None on a miss or cache error."""
+    try:
+        entry = _enhance_cache.get(key)
+    except (sqlite3.Error, OSError, ValueError) as e:
+        logger.debug("Enhancement cache unavailable: %s", e)
+        return None
+    return entry["prompt"] if entry else None
+
+
+def _cached_enhancement(func):
+    """Cache the enhanced prompt on (query, context, focus, format, model).
+
+    The wrapped coroutine accepts an extra ``use_cache`` keyword; pass
+    ``use_cache=False`` to always call the model. Cache failures never
+    prevent enhancement, and fallbacks to the raw query are not cached.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(
+        query: str,
+        context: Optional[str] = None,
+        focus: Optional[str] = None,
+        format_type: Optional[str] = None,
+        client: AsyncOpenAI = None,
+        use_cache: bool = True
+    ) -> str:
+        if not use_cache:
+            return await func(query, context, focus, format_type, client)
+
+        key = _enhancement_key(query, context, focus, format_type)
+        cached = _lookup_enhancement(key)
+        if cached is not None:
+            logger.info("⚡ Using cached prompt enhancement")
+            return cached
+
+        enhanced = await func(query, context, focus, format_type, client)
+        if enhanced != query:
+            try:
+                _enhance_cache.set(key, {"prompt": enhanced}, _ENHANCE_CACHE_TTL)
+            except (sqlite3.Error, OSError) as e:
+                logger.debug("Could not cache enhanced prompt: %s", e)
+        return enhanced
+
+    return wrapper
+
+
+@_cached_enhancement
+async def enhance_research_prompt(
+    query: str,
+    context: Optional[str] = None,
+    focus: Optional[str] = None,
+    format_type: Optional[str] = None,
+    client: AsyncOpenAI = None
+) -> str:
+    """Enhance the research prompt using an intermediate model like gpt-5-mini."""
 
     # Build the enhanced prompt request
     prompt_parts = [f"Research Query: {query}"]
@@ -111,40 +328,194 @@ GUIDELINES:
     input_text = "\n\n".join(prompt_parts)
 
     try:
-        logger.debug("Enhancing research prompt with gpt-5-mini...")
+        logger.debug("Enhancing research prompt with %s...", _ENHANCE_MODEL)
 
         response = await client.responses.create(
-            model="gpt-5-mini",
+            model=_ENHANCE_MODEL,
             input=input_text,
-            instructions=instructions,
+            instructions=_ENHANCE_INSTRUCTIONS,
             reasoning={"effort": "low"},
-            text={"verbosity": "medium"}
+            text={"verbosity": "medium"},
+            # Passed as a raw field so older SDKs without the argument still work
+            extra_body={"prompt_cache_key": _ENHANCE_PROMPT_CACHE_KEY}
         )
 
         enhanced_prompt = response.output_text
-        logger.debug(f"Enhanced prompt length: {len(enhanced_prompt)} characters")
+        logger.debug("Enhanced prompt length: %s characters", len(enhanced_prompt))
+
+        usage = getattr(response, "usage", None)
+        input_tokens = _usage_field(usage, "input_tokens") if usage else None
+        if input_tokens:
+            details = _usage_field(usage, "input_tokens_details")
+            cached_tokens = (_usage_field(details, "cached_tokens") if details else 0) or 0
+            logger.debug(
+                "Enhancement prompt cache: %s/%s input tokens cached (%.0f%%)",
+                cached_tokens, input_tokens, 100 * cached_tokens / input_tokens
+            )
         return enhanced_prompt
 
     except Exception as e:
-        logger.warning(f"Prompt enhancement failed, using original query: {e}")
+        logger.warning("Prompt enhancement failed, using original query: %s", e)
         return query
 
 
-def setup_file_logging(output_path: str) -> tuple[str, str]:
+def _rel(path: Path, cwd: Path) -> str:
+    """Return ``path`` relative to ``cwd``, or absolute if it lies outside it."""
+    path = cwd / path
+    try:
+        return str(path.relative_to(cwd))
+    except ValueError:
+        return str(path)
+
+
+# Log files are written by a listener thread so logging never blocks the
+# event loop; the logger itself only enqueues records
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+_log_listener: Optional[QueueListener] = None
+_log_lock = threading.Lock()
+
+# Log session of the running research call; its records only reach its own
+# log file, so concurrent queries in one process keep separate logs
+_log_session: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar(
+    "deepresearch_log_session", default=None
+)
+_log_session_ids = itertools.count(1)
+
+
+class _SessionTagFilter(logging.Filter):
+    """Stamp each record with the log session of the code that logged it."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "log_session"):
+            record.log_session = _log_session.get()
+        return True
+
+
+class _SessionRouter(logging.Handler):
+    """Hand each record to the file handler of its log session.
+
+    Runs on the listener thread. A record with ``close_session`` set closes
+    that session's file instead, after every record queued before it.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._files: dict[Optional[int], list[logging.Handler]] = {}
+
+    def add(self, session: Optional[int], handler: logging.Handler) -> None:
+        with self.lock:
+            self._files.setdefault(session, []).append(handler)
+
+    def close_session(self, session: Optional[int]) -> None:
+        with self.lock:
+            for handler in self._files.pop(session, []):
+                handler.close()
+
+    def close_sessions(self) -> None:
+        with self.lock:
+            for session in list(self._files):
+                self.close_session(session)
+
+    def close(self) -> None:
+        self.close_sessions()
+        super().close()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        session = getattr(record, "log_session", None)
+        if getattr(record, "close_session", False):
+            self.close_session(session)
+            return
+        for handler in self._files.get(session, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+_queue_handler.addFilter(_SessionTagFilter())
+_session_router = _SessionRouter()
+
+
+def _add_file_handler(handler: logging.Handler) -> None:
+    """Have the listener thread write the current session's records to ``handler``."""
+    global _log_listener
+    with _log_lock:
+        _session_router.add(_log_session.get(), handler)
+        if _log_listener is None:
+            _log_listener = QueueListener(_log_queue, _session_router)
+            _log_listener.start()
+        if _queue_handler not in logger.handlers:
+            logger.addHandler(_queue_handler)
+
+
+def _end_log_session(session: Optional[int]) -> None:
+    """Close the log files of ``session`` once its queued records are written."""
+    with _log_lock:
+        if _log_listener is None:
+            _session_router.close_session(session)
+            return
+        _log_queue.put_nowait(logging.makeLogRecord(
+            {"levelno": logging.INFO, "log_session": session, "close_session": True}
+        ))
+
+
+def _in_log_session(func):
+    """Run each call of the wrapped coroutine in a log session of its own.
+
+    Log files set up during the call only receive the call's records, and
+    are closed when it returns.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        session = next(_log_session_ids)
+        token = _log_session.set(session)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _log_session.reset(token)
+            _end_log_session(session)
+
+    return wrapper
+
+
+def _stop_file_logging() -> None:
+    """Flush queued records to the log files, then close them."""
+    global _log_listener
+    with _log_lock:
+        logger.removeHandler(_queue_handler)
+        if _log_listener is not None:
+            _log_listener.stop()
+            _log_listener = None
+        _session_router.close_sessions()
+
+
+atexit.register(_stop_file_logging)
+
+
+def setup_file_logging(
+    output_path,
+    output_dir: Optional[Path] = None,
+    cwd: Optional[Path] = None
+) -> tuple[str, str]:
     """Setup file logging in the same directory as the output file.
 
+    Args:
+        output_path: Path of the results file the log belongs to
+        output_dir: Its directory, if already known; created if missing
+        cwd: Working directory for the relative path, if already known
+
     Returns:
         tuple[str, str]: (absolute_log_path, relative_log_path)
     """
-    output_dir = Path(output_path).parent
+    output_path = Path(output_path)
+    if output_dir is None:
+        output_dir = output_path.parent
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Create log filename based on output filename
-    output_stem = Path(output_path).stem
-    log_filename = f"{output_stem}_deepresearch.log"
-    log_path = output_dir / log_filename
+    log_path = output_dir / f"{output_path.stem}_deepresearch.log"
 
-    # Add file handler to the root logger
+    # Create the file handler
     file_handler = logging.FileHandler(log_path, mode='w', encoding='utf-8')
     file_handler.setLevel(logging.INFO)
     file_formatter = logging.Formatter(
@@ -152,22 +523,410 @@ def setup_file_logging(output_path: str) -> tuple[str, str]:
     )
     file_handler.setFormatter(file_formatter)
 
-    # Add file handler to our logger
-    logger.addHandler(file_handler)
+    # Write this session's records to it from the listener thread
+    _add_file_handler(file_handler)
 
     # Return both absolute and relative paths
-    abs_log_path = str(log_path.absolute())
+    if cwd is None:
+        cwd = Path.cwd()
+    abs_log_path = str(cwd / log_path)
+    rel_log_path = _rel(log_path, cwd)
+
+    return abs_log_path, rel_log_path
+
+
+# Background jobs that were submitted but whose results haven't been saved
+# yet, one file per response ID so concurrent CLI processes never overwrite
+# each other's records
+_PENDING_DIR = _CACHE_DIR / "pending"
+
+# IDs submitted by this process, reported if the run is interrupted
+_submitted_ids: list[str] = []
+
+
+def _pending_path(response_id: str) -> Optional[Path]:
+    """Return the record file for ``response_id``, or None if it isn't a valid ID."""
+    if not response_id or Path(response_id).name != response_id or response_id.startswith("."):
+        return None
+    return _PENDING_DIR / f"{response_id}.json"
 
-    # Calculate relative path safely
+
+def _load_pending() -> list[dict]:
+    """Return the pending background jobs recorded on disk."""
+    entries = []
     try:
-        rel_log_path = str(log_path.relative_to(Path.cwd()))
-    except ValueError:
-        # If the log path is outside the current working directory, use absolute path
-        rel_log_path = abs_log_path
+        paths = sorted(_PENDING_DIR.glob("*.json"))
+    except OSError:
+        return []
+    for path in paths:
+        try:
+            entries.append(_json_loads(path.read_bytes()))
+        except FileNotFoundError:
+            continue
+        except (OSError, ValueError) as e:
+            logger.warning("⚠️  Could not read pending job from %s: %s", path, e)
+    return entries
+
+
+def _add_pending(entry: dict) -> None:
+    """Record a submitted background job so it can be resumed later.
+
+    The record is written atomically; this blocks on ``fsync``, so call it
+    through ``asyncio.to_thread`` from the event loop.
+    """
+    _submitted_ids.append(entry["id"])
+    path = _pending_path(entry["id"])
+    if path is None:
+        logger.warning("⚠️  Could not record pending job %s: invalid ID", entry['id'])
+        return
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        _PENDING_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(entry, indent=True))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("⚠️  Could not record pending job %s: %s", entry['id'], e)
+
+
+def _remove_pending(response_id: str) -> None:
+    """Forget a background job once it has finished."""
+    path = _pending_path(response_id)
+    if path is None:
+        return
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("⚠️  Could not remove pending job %s: %s", response_id, e)
+
+
+def _find_pending(response_id: str) -> Optional[dict]:
+    """Return the recorded pending job with ``response_id``, if any."""
+    path = _pending_path(response_id)
+    if path is None:
+        return None
+    try:
+        return _json_loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("⚠️  Could not read pending job from %s: %s", path, e)
+        return None
+
+
+def _print_resume_hint() -> None:
+    """Tell the user how to resume jobs still running after an interrupt."""
+    pending = {entry.get("id") for entry in _load_pending()}
+    for response_id in _submitted_ids:
+        if response_id in pending:
+            print(f"⏳ Research {response_id} is still running on OpenAI", file=sys.stderr)
+            print(f"   Resume with: deepresearch --resume {response_id}", file=sys.stderr)
+
+
+async def _sleep_with_backoff(interval: float, poll_max: float) -> float:
+    """Sleep for ``interval`` seconds plus jitter and return the next interval.
+
+    The delay grows geometrically up to ``poll_max`` so that fast jobs are
+    detected quickly while long jobs don't issue needless status requests.
+    """
+    await asyncio.sleep(interval + random.uniform(0, interval * 0.1))
+    return min(interval * 1.7, poll_max)
+
+
+# Errors worth retrying a status poll for: connection errors, 429s and 5xx;
+# other API errors (bad request, not found, auth) fail immediately
+_TRANSIENT_ERRORS = (
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+# Attempts per status poll before a transient error is given up on
+_POLL_ATTEMPTS = 10
+
+
+def _transient_delay(error: BaseException, attempt: int) -> float:
+    """Return the delay before retrying after the ``attempt``-th transient error.
+
+    Waits as long as a rate limit response asks, else backs off exponentially
+    (1s, 2s, 4s, ... plus up to 1s of jitter, at most 30s).
+    """
+    if isinstance(error, openai.RateLimitError):
+        try:
+            return float(error.response.headers.get("retry-after"))
+        except (TypeError, ValueError):
+            pass
+    return min(2 ** (attempt - 1) + random.uniform(0, 1), 30.0)
+
+
+def _wait_retry_after(retry_state) -> float:
+    return _transient_delay(retry_state.outcome.exception(), retry_state.attempt_number)
+
+
+def _log_retry(retry_state) -> None:
+    logger.debug(
+        "Polling error (attempt %s): %s",
+        retry_state.attempt_number,
+        retry_state.outcome.exception()
+    )
+
+
+# Status polls are retried on transient errors
+_retry_transient = retry(
+    retry=retry_if_exception_type(_TRANSIENT_ERRORS),
+    wait=_wait_retry_after,
+    stop=stop_after_attempt(_POLL_ATTEMPTS),
+    before_sleep=_log_retry,
+    reraise=True
+)
+
+
+@_retry_transient
+async def _poll_batch_once(client: AsyncOpenAI, batch_id: str):
+    """Retrieve the current state of a batch job."""
+    return await client.with_options(max_retries=0).batches.retrieve(batch_id)
+
+
+# Response statuses after which a background job won't change any more
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled", "incomplete"})
+
+# When a poll round runs, polls due within this many seconds join it early
+_POLL_COALESCE_WINDOW = 1.0
 
-    return abs_log_path, rel_log_path
 
+class _Waiter:
+    """Polling state of one background response awaited by ``_ResponsePoller``."""
 
+    def __init__(self, future: asyncio.Future, interval: float, poll_max: float, due: float):
+        self.future = future
+        # Status lines go to the log of the research call that is waiting
+        self.log_session = _log_session.get()
+        self.initial = interval
+        self.interval = interval
+        self.poll_max = poll_max
+        self.due = due
+        self.status: Optional[str] = None
+        # Consecutive transient poll errors
+        self.errors = 0
+
+
+class _ResponsePoller:
+    """Poll every outstanding background response of a client from one task.
+
+    Each round retrieves all due responses concurrently, so many jobs share
+    the multiplexed HTTP/2 connection instead of running independent polling
+    loops. Every response keeps its own backoff schedule, which restarts from
+    the initial interval whenever its status changes (e.g. queued to
+    in_progress), and its waiter is woken through a future once it reaches a
+    terminal status. A round makes one attempt per response: a transient
+    error reschedules that response alone, so it never holds up the others.
+    """
+
+    def __init__(self, client: AsyncOpenAI):
+        self.client = client
+        self.loop = asyncio.get_running_loop()
+        self._waiters: dict[str, _Waiter] = {}
+        self._changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def wait(self, response_id: str, poll_interval: float = 2.0, poll_max: float = 60.0):
+        """Wait for ``response_id`` to reach a terminal status and return it."""
+        waiter = self._waiters.get(response_id)
+        if waiter is None or waiter.future.done():
+            waiter = _Waiter(self.loop.create_future(), poll_interval, poll_max, self.loop.time())
+            self._waiters[response_id] = waiter
+            self._changed.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        return await waiter.future
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                # Forget waiters whose research call was cancelled
+                for response_id in [rid for rid, w in self._waiters.items() if w.future.done()]:
+                    del self._waiters[response_id]
+                if not self._waiters:
+                    return
+
+                now = self.loop.time()
+                next_due = min(w.due for w in self._waiters.values())
+                if next_due <= now:
+                    horizon = now + _POLL_COALESCE_WINDOW
+                    due = [rid for rid, w in self._waiters.items() if w.due <= horizon]
+                    # Retries are scheduled here rather than by the SDK
+                    responses = self.client.with_options(max_retries=0).responses
+                    results = await asyncio.gather(
+                        *(responses.retrieve(rid) for rid in due),
+                        return_exceptions=True
+                    )
+                    for response_id, result in zip(due, results):
+                        self._dispatch(response_id, result)
+                    continue
+
+                self._changed.clear()
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout=next_due - now)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException as e:
+            # Never leave a research call waiting on a dead poller
+            for waiter in self._waiters.values():
+                if not waiter.future.done():
+                    waiter.future.set_exception(e)
+            self._waiters.clear()
+            raise
+
+    def _dispatch(self, response_id: str, result) -> None:
+        waiter = self._waiters.get(response_id)
+        if waiter is None or waiter.future.done():
+            return
+
+        if isinstance(result, _TRANSIENT_ERRORS) and waiter.errors + 1 < _POLL_ATTEMPTS:
+            waiter.errors += 1
+            logger.debug("Polling error (attempt %s): %s", waiter.errors, result)
+            waiter.due = self.loop.time() + _transient_delay(result, waiter.errors)
+            return
+
+        if isinstance(result, BaseException):
+            waiter.future.set_exception(result)
+        elif result.status in _TERMINAL_STATUSES:
+            waiter.future.set_result(result)
+        else:
+            waiter.errors = 0
+            logger.info(
+                "⏳ Status: %s (%s)", result.status, response_id,
+                extra={"log_session": waiter.log_session}
+            )
+            if result.status != waiter.status:
+                # A transition means progress; check again soon
+                waiter.status = result.status
+                waiter.interval = waiter.initial
+            waiter.due = self.loop.time() + waiter.interval + random.uniform(0, waiter.interval * 0.1)
+            waiter.interval = min(waiter.interval * 1.7, waiter.poll_max)
+            return
+
+        del self._waiters[response_id]
+
+
+# One poller per shared client, recreated for each event loop
+_pollers: dict[AsyncOpenAI, _ResponsePoller] = {}
+
+
+def _get_poller(client: AsyncOpenAI) -> _ResponsePoller:
+    """Return the background response poller for ``client`` on the running loop."""
+    poller = _pollers.get(client)
+    if poller is None or poller.loop is not asyncio.get_running_loop():
+        poller = _pollers[client] = _ResponsePoller(client)
+    return poller
+
+
+# Stream events that carry the final state of a response
+_TERMINAL_EVENTS = frozenset({"response.completed", "response.failed", "response.incomplete"})
+
+
+async def _wait_for_response(
+    client: AsyncOpenAI,
+    response_id: str,
+    events=None,
+    poll_interval: float = 2.0,
+    poll_max: float = 60.0
+):
+    """Wait for a background response to finish, preferring server-sent events.
+
+    The server pushes completion over the event stream the moment it happens,
+    so no status polling is needed. Without ``events`` (e.g. when resuming), a
+    stream is reopened with ``responses.retrieve(stream=True)``. If the
+    response can't be streamed, or the stream ends before a terminal event,
+    the shared poller takes over.
+
+    Returns:
+        The response in a terminal status
+    """
+
+    try:
+        if events is None:
+            events = await client.responses.retrieve(response_id, stream=True)
+        async with events:
+            async for event in events:
+                if event.type in _TERMINAL_EVENTS:
+                    return event.response
+                if event.type in ("response.queued", "response.in_progress"):
+                    logger.info("⏳ Status: %s (%s)", event.response.status, response_id)
+                elif event.type == "error":
+                    logger.debug("Stream error for %s: %s", response_id, event.message)
+                    break
+    except (openai.APIError, _http.HTTPError) as e:
+        # APIError also covers error payloads the SDK raises mid-stream
+        logger.debug("Streaming unavailable for %s: %s", response_id, e)
+
+    logger.info("⏳ Polling for completion...")
+    return await _get_poller(client).wait(response_id, poll_interval, poll_max)
+
+
+# Tools enabled for every Deep Research call
+_RESEARCH_TOOLS = [{"type": "web_search_preview"}]
+
+# Deep Research models accepted on the command line and in --stdin records
+_RESEARCH_MODELS = ("o3-deep-research", "o4-mini-deep-research")
+
+# Completed research results, reused for repeated (or similar) queries
+_response_cache = ResponseCache(SQLiteBackend(_CACHE_DIR / "responses.sqlite"))
+
+
+async def _embed_query(client: AsyncOpenAI, text: str) -> Optional[list[float]]:
+    """Embed ``text`` for a semantic cache lookup, or None if embedding fails."""
+    try:
+        response = await client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+        return response.data[0].embedding
+    except Exception as e:
+        logger.debug("Query embedding failed, skipping semantic cache: %s", e)
+        return None
+
+
+def _lookup_research(key: str) -> Optional[dict]:
+    """Return the research entry cached under the exact ``key``, if any."""
+    try:
+        return _response_cache.get(key)
+    except (sqlite3.Error, OSError, ValueError) as e:
+        logger.debug("Response cache unavailable: %s", e)
+        return None
+
+
+def _lookup_similar_research(
+    embedding: list[float],
+    model: str,
+    options: Optional[dict] = None
+) -> Optional[dict]:
+    """Return the cached research entry most similar to ``embedding``, if any."""
+    try:
+        return _response_cache.get_similar(embedding, model, options)
+    except (sqlite3.Error, OSError, ValueError) as e:
+        logger.debug("Response cache unavailable: %s", e)
+        return None
+
+
+def _store_research(
+    key: str,
+    result: str,
+    model: str,
+    usage_data=None,
+    embedding: Optional[list[float]] = None,
+    options: Optional[dict] = None
+) -> None:
+    """Cache a completed research result; failures are only logged."""
+    usage = usage_data.model_dump() if hasattr(usage_data, "model_dump") else None
+    try:
+        _response_cache.set(key, result, model, usage, embedding, options)
+    except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+        logger.debug("Could not cache research result: %s", e)
+
+
+@_in_log_session
 async def conduct_research(
     query: str,
     output_path: str,
@@ -176,7 +935,14 @@ async def conduct_research(
     context: Optional[str] = None,
     focus: Optional[str] = None,
     background: bool = True,
-    enhance_prompt: bool = True
+    enhance_prompt: bool = True,
+    poll_interval: float = 2.0,
+    poll_max: float = 60.0,
+    client: Optional[AsyncOpenAI] = None,
+    use_cache: bool = True,
+    resume_id: Optional[str] = None,
+    semantic_cache: bool = False,
+    poll_timeout: Optional[float] = 3600.0
 ) -> str:
     """Conduct deep research using OpenAI's Deep Research API.
 
@@ -189,227 +955,678 @@ async def conduct_research(
         focus: Source focus (e.g., academic, reports, news, etc.)
         background: Whether to use background mode
         enhance_prompt: Whether to use prompt enhancement with intermediate model
+        poll_interval: Initial delay in seconds between background status polls
+        poll_max: Upper bound in seconds for the poll delay as it backs off
+        client: OpenAI client to use (defaults to the shared client)
+        use_cache: Whether to reuse cached prompt enhancements and research
+            results when available
+        resume_id: ID of an already submitted background response to resume
+            polling instead of starting new research
+        semantic_cache: Whether to also reuse the result of a sufficiently
+            similar earlier query (embeds queries without an exact match)
+        poll_timeout: Maximum time in seconds to wait for background research
+            (None or 0 waits indefinitely); the job keeps running and can be
+            resumed after a timeout
 
     Returns:
         The research results as a string
     """
 
-    # Setup file logging first
-    abs_log_path, rel_log_path = setup_file_logging(output_path)
-
-    # Create output directory (ensures it exists)
-    output_dir = Path(output_path).parent
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Calculate relative paths for logging
+    if client is None:
+        client = get_client()
+
+    # Start the prompt enhancement first: it only needs the query, so the
+    # model round-trip overlaps the file logging and directory setup. A cached
+    # enhancement is picked up here and reported once the log file is attached.
+    enhancement = cached_prompt = None
+    if enhance_prompt and not resume_id:
+        if use_cache:
+            cached_prompt = _lookup_enhancement(_enhancement_key(query, context, focus, format_type))
+        if cached_prompt is None:
+            enhancement = asyncio.create_task(enhance_research_prompt(
+                query, context, focus, format_type, client, use_cache=use_cache
+            ))
+
+    # Resolve the output locations once
+    out_p = Path(output_path)
+    out_dir = out_p.parent
+    cwd = Path.cwd()
+
+    # Setup file logging (this also creates the output directory)
     try:
-        rel_output_path = str(Path(output_path).relative_to(Path.cwd()))
-    except ValueError:
-        # If the output path is outside the current working directory
-        rel_output_path = str(Path(output_path).absolute())
+        abs_log_path, rel_log_path = await asyncio.to_thread(setup_file_logging, out_p, out_dir, cwd)
+    except BaseException:
+        if enhancement:
+            enhancement.cancel()
+        raise
 
-    try:
-        rel_output_dir = str(output_dir.relative_to(Path.cwd()))
-    except ValueError:
-        # If the output directory is outside the current working directory
-        rel_output_dir = str(output_dir.absolute())
+    # Calculate relative paths for logging
+    rel_output_path = _rel(out_p, cwd)
+    rel_output_dir = _rel(out_dir, cwd)
 
     # Clear, transparent logging about file locations
     logger.info("=" * 60)
     logger.info("🚀 DEEP RESEARCH SESSION STARTED")
     logger.info("=" * 60)
-    logger.info(f"📁 Working directory: {rel_output_dir}")
-    logger.info(f"📄 Results will be saved to: {rel_output_path}")
-    logger.info(f"📋 Log file will be saved to: {rel_log_path}")
+    logger.info("📁 Working directory: %s", rel_output_dir)
+    logger.info("📄 Results will be saved to: %s", rel_output_path)
+    logger.info("📋 Log file will be saved to: %s", rel_log_path)
     logger.info("=" * 60)
 
-    config = DeepResearchConfig()
-    client = AsyncOpenAI(
-        api_key=config.openai_api_key,
-        timeout=3600  # 1 hour timeout
-    )
-
-    logger.info(f"🔍 Starting Deep Research for: {query[:100]}...")
-    logger.info(f"📝 Using model: {model}")
+    logger.info("🔍 Starting Deep Research for: %s...", query[:100])
+    logger.info("📝 Using model: %s", model)
     if format_type:
-        logger.info(f"📄 Output format: {format_type}")
+        logger.info("📄 Output format: %s", format_type)
     if context:
-        logger.info(f"📋 Background context provided")
+        logger.info("📋 Background context provided")
     if focus:
-        logger.info(f"🎯 Source focus: {focus}")
+        logger.info("🎯 Source focus: %s", focus)
 
-    if background:
+    if resume_id:
+        # A resumed response is always a background one
+        background = True
+    elif background:
         logger.info("⏱️  Using background mode (research may take 5-10 minutes)")
 
     try:
+        if resume_id:
+            response_id = resume_id
+            logger.info("🔁 Resuming background research! Request ID: %s", response_id)
         # Enhance the prompt if requested
-        if enhance_prompt:
+        elif cached_prompt is not None:
+            logger.info("⚡ Using cached prompt enhancement")
+            enhanced_query = cached_prompt
+        elif enhancement:
             logger.info("✨ Enhancing research prompt...")
-            enhanced_query = await enhance_research_prompt(
-                query, context, focus, format_type, client
-            )
+            enhanced_query = await enhancement
         else:
             # Build a basic enhanced query
             enhanced_query = _build_basic_query(query, context, focus, format_type)
-        # Make the Deep Research API call
-        response = await client.responses.create(
-            model=model,
-            input=enhanced_query,
-            background=background,
-            reasoning={"summary": "auto"},
-            tools=[{"type": "web_search_preview"}]
-        )
+
+        # Reuse a stored result for the same (or a similar) request
+        cache_key = embedding = None
+        options = {"context": context, "focus": focus, "format": format_type}
+        if use_cache and not resume_id:
+            cache_key = exact_key(model, enhanced_query, _RESEARCH_TOOLS)
+            cached = _lookup_research(cache_key)
+            if cached is None and semantic_cache:
+                # Embed the user's own words: the templated research prompt
+                # shares enough boilerplate to make unrelated queries look alike
+                embedding = await _embed_query(client, query)
+                if embedding:
+                    cached = _lookup_similar_research(embedding, model, options)
+            if cached is not None:
+                logger.info("⚡ Using cached research result")
+                async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
+                    await f.write(_format_results(cached["result"], query, model))
+                logger.info("💾 Results saved to: %s", rel_output_path)
+                return cached["result"]
+
+        events = None
+        if background and not resume_id:
+            # Make the Deep Research API call, streaming its progress events
+            events = await client.responses.create(
+                model=model,
+                input=enhanced_query,
+                background=True,
+                stream=True,
+                reasoning={"summary": "auto"},
+                tools=_RESEARCH_TOOLS
+            )
+            # The first event carries the new response
+            created = await events.__anext__()
+            response_id = created.response.id
+
+            # Remember the job so an interrupted run can be resumed
+            await asyncio.to_thread(_add_pending, {
+                "id": response_id,
+                "query": query,
+                "output_path": str(cwd / out_p),
+                "model": model,
+                "ts": datetime.now().isoformat(timespec="seconds")
+            })
+            logger.info("✅ Research started in background! Request ID: %s", response_id)
 
         if background:
-            logger.info(f"✅ Research started in background! Request ID: {response.id}")
-            logger.info("⏳ Polling for completion...")
+            logger.info("⏳ Waiting for completion...")
 
-            # Poll for completion
-            final_response = None
-            while True:
-                try:
-                    status_response = await client.responses.retrieve(response.id)
-
-                    if hasattr(status_response, 'status'):
-                        if status_response.status == "completed":
-                            logger.info("🎉 Research completed!")
-                            research_result = status_response.output_text
-                            final_response = status_response
-                            break
-                        elif status_response.status == "failed":
-                            logger.error("❌ Research failed")
-                            return "Research failed"
-                        else:
-                            logger.info(f"⏳ Status: {status_response.status}")
-
-                    await asyncio.sleep(30)  # Poll every 30 seconds
-
-                except Exception as poll_error:
-                    logger.debug(f"Polling error: {poll_error}")
-                    await asyncio.sleep(30)
+            try:
+                final_response = await asyncio.wait_for(
+                    _wait_for_response(client, response_id, events, poll_interval, poll_max),
+                    timeout=poll_timeout or None
+                )
+            except asyncio.TimeoutError:
+                # The job is left pending on purpose so it can be resumed
+                logger.error("⌛ Research %s still running after %ss", response_id, poll_timeout)
+                logger.info("🔁 Resume with: deepresearch --resume %s", response_id)
+                return f"Error: Timed out after {poll_timeout}s waiting for research {response_id}"
+
+            if final_response.status != "completed":
+                logger.error("❌ Research %s", final_response.status)
+                await asyncio.to_thread(_remove_pending, response_id)
+                return f"Error: Research {response_id} ended with status {final_response.status}"
+
+            logger.info("🎉 Research completed!")
+            research_result = final_response.output_text
 
         else:
-            # Synchronous mode
-            research_result = response.output_text
-            final_response = response
+            # Synchronous mode: the report is written to disk as it streams in
+            final_response = await _stream_research(
+                client, model, enhanced_query, output_path, query
+            )
+            research_result = final_response.output_text
             logger.info("✅ Research completed!")
 
         # Extract usage information and calculate cost
         cost_info = None
         usage_data = getattr(final_response, 'usage', None)
         if usage_data:
-            # Convert usage object to dict if needed
-            if hasattr(usage_data, '__dict__'):
-                usage_dict = usage_data.__dict__
-            else:
-                usage_dict = usage_data
-
-            cost_info = _calculate_cost(usage_dict, model)
+            cost_info = _calculate_cost(usage_data, model)
 
-            # Log cost information
+            # Log cost information (skip the formatting when INFO is filtered out)
             if "error" not in cost_info:
-                logger.info("💰 COST BREAKDOWN:")
-                logger.info(f"📊 Total Tokens: {cost_info['total_tokens']:,}")
-                logger.info(f"📝 Input Tokens: {cost_info['input_tokens']:,} (${cost_info['input_cost']:.4f})")
-                if cost_info['cached_tokens'] > 0:
-                    logger.info(f"⚡ Cached Tokens: {cost_info['cached_tokens']:,} (${cost_info['cached_cost']:.4f})")
-                logger.info(f"📤 Output Tokens: {cost_info['output_tokens']:,} (${cost_info['output_cost']:.4f})")
-                logger.info(f"💵 TOTAL COST: ${cost_info['total_cost']:.4f}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("💰 COST BREAKDOWN:")
+                    logger.info("📊 Total Tokens: %s", format(cost_info['total_tokens'], ","))
+                    logger.info("📝 Input Tokens: %s ($%.4f)", format(cost_info['input_tokens'], ","), cost_info['input_cost'])
+                    if cost_info['cached_tokens'] > 0:
+                        logger.info("⚡ Cached Tokens: %s ($%.4f)", format(cost_info['cached_tokens'], ","), cost_info['cached_cost'])
+                    logger.info("📤 Output Tokens: %s ($%.4f)", format(cost_info['output_tokens'], ","), cost_info['output_cost'])
+                    logger.info("💵 TOTAL COST: $%.4f", cost_info['total_cost'])
             else:
-                logger.warning(f"⚠️  Cost calculation failed: {cost_info.get('error', 'Unknown error')}")
+                logger.warning("⚠️  Cost calculation failed: %s", cost_info.get('error', 'Unknown error'))
 
         # Save results to file (directory already created)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(_format_results(research_result, query, model, cost_info))
+        if background:
+            async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
+                await f.write(_format_results(research_result, query, model, cost_info))
+        else:
+            # Usage is only known once the stream ends, so costs go after the content
+            async with aiofiles.open(output_path, 'a', encoding='utf-8') as f:
+                await f.write(_format_cost_section(cost_info) + _RESULT_FOOTER)
+
+        if background:
+            await asyncio.to_thread(_remove_pending, response_id)
+        if cache_key:
+            _store_research(cache_key, research_result, model, usage_data, embedding, options)
 
-        logger.info(f"💾 Results saved to: {rel_output_path}")
-        logger.info(f"📊 Result length: {len(research_result)} characters")
+        logger.info("💾 Results saved to: %s", rel_output_path)
+        logger.info("📊 Result length: %s characters", len(research_result))
 
         return research_result
 
+    except openai.APIStatusError as e:
+        # 429s and 5xx have already been retried by the client; report what's
+        # left with the fields needed to look the request up with OpenAI
+        logger.error("❌ Deep Research API error %s (request ID: %s): %s", e.status_code, e.request_id, e.message)
+        return f"Error: Deep Research API error {e.status_code}: {e.message}"
+
     except Exception as e:
         error_msg = f"Deep Research API error: {str(e)}"
         logger.error(error_msg)
         return f"Error: {error_msg}"
 
 
-def _build_basic_query(query: str, context: Optional[str], focus: Optional[str], format_type: Optional[str]) -> str:
-    """Build a basic enhanced query without using prompt enhancement."""
+async def _stream_research(
+    client: AsyncOpenAI,
+    model: str,
+    enhanced_query: str,
+    output_path: str,
+    query: str
+):
+    """Stream a synchronous research response into ``output_path``.
 
-    parts = [f"Research Query: {query}"]
+    The metadata header is written first and the text is appended a line at
+    a time as it arrives, so the report can be followed while it is
+    generated. Deltas are single tokens, so they are collected until a line
+    ends rather than written (one worker-thread hop each) individually. The
+    caller appends the footer once usage is known.
 
-    if context:
-        parts.append(f"Background Context: {context}")
-
-    # Source focus guidance
-    focus_instructions = {
-        "academic": "Prioritize peer-reviewed research, academic papers, official publications, and scholarly sources.",
-        "business": "Focus on industry reports, market research, financial data, company reports, and business analytics.",
-        "news": "Emphasize recent news articles, press releases, official statements, and current events coverage.",
-        "reports": "Concentrate on official reports, government documents, white papers, and institutional publications.",
-        "technical": "Focus on technical documentation, specifications, standards, and expert technical sources."
-    }
+    Returns:
+        The final response object
+    """
+
+    # Line buffering pushes every completed line to disk straight away
+    async with aiofiles.open(output_path, 'w', encoding='utf-8', buffering=1) as f:
+        await f.write(_format_header(query, model))
+
+        async with client.responses.stream(
+            model=model,
+            input=enhanced_query,
+            reasoning={"summary": "auto"},
+            tools=_RESEARCH_TOOLS
+        ) as stream:
+            pending = []
+            async for event in stream:
+                if event.type == "response.output_text.delta":
+                    pending.append(event.delta)
+                    if "\n" in event.delta:
+                        await f.write("".join(pending))
+                        pending.clear()
+            if pending:
+                await f.write("".join(pending))
+
+            return await stream.get_final_response()
+
+
+def _load_queries(path_in: str) -> list[dict]:
+    """Load queries from a JSONL file, assigning an ``id`` to each entry.
+
+    Each non-empty line is a JSON object with a ``query`` key and optional
+    ``id`` (or Batch API style ``custom_id``), ``context``, ``focus`` and
+    ``format`` keys. Entries without an id are named ``query-<line number>``.
+    """
+
+    items = []
+    seen = set()
+    with open(path_in, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            item = _json_loads(line)
+            if "query" not in item:
+                raise ValueError(f"Missing 'query' on line {line_number} of {path_in}")
+            item["id"] = str(item.get("id") or item.get("custom_id") or f"query-{line_number}")
+            if item["id"] in seen:
+                raise ValueError(f"Duplicate query id in {path_in}: {item['id']}")
+            seen.add(item["id"])
+            items.append(item)
+
+    if not items:
+        raise ValueError(f"No queries found in {path_in}")
+
+    return items
+
+
+async def _run_many(
+    queries: list[dict],
+    out_dir: str,
+    max_concurrency: int = 8,
+    client: Optional[AsyncOpenAI] = None,
+    format_type: Optional[str] = None,
+    context: Optional[str] = None,
+    focus: Optional[str] = None,
+    **research_kwargs
+) -> list[str]:
+    """Run several research queries concurrently on one event loop.
+
+    All queries share the same OpenAI client so connections are reused, and
+    at most ``max_concurrency`` of them are in flight at any time.
+
+    Args:
+        queries: Entries as returned by ``_load_queries``
+        out_dir: Directory where one markdown file per query is written
+        max_concurrency: Maximum number of concurrent research jobs
+        client: OpenAI client to use (defaults to the shared client)
+        format_type: Output format for queries that don't set ``format``
+        context: Background context for queries that don't set ``context``
+        focus: Source focus for queries that don't set ``focus``
+        **research_kwargs: Extra arguments forwarded to ``conduct_research``
+
+    Returns:
+        The research result (or error message) for each query, in order
+    """
+
+    if client is None:
+        client = get_client()
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _run_one(item: dict) -> str:
+        async with sem:
+            return await conduct_research(
+                query=item["query"],
+                output_path=str(Path(out_dir) / f"{item['id']}.md"),
+                format_type=item.get("format") or format_type,
+                context=item.get("context") or context,
+                focus=item.get("focus") or focus,
+                client=client,
+                **research_kwargs
+            )
+
+    results = await asyncio.gather(
+        *(_run_one(item) for item in queries), return_exceptions=True
+    )
+    return [
+        f"Error: {result}" if isinstance(result, BaseException) else result
+        for result in results
+    ]
+
+
+@dataclass(frozen=True)
+class _StdinRecord:
+    """One research request read from stdin in ``--stdin`` mode."""
+
+    query: str
+    output: str
+    context: Optional[str] = None
+    focus: Optional[str] = None
+    format: Optional[str] = None
+    model: Optional[str] = None
+
+    @classmethod
+    def from_json(cls, data) -> "_StdinRecord":
+        """Validate a decoded JSON line, raising ``ValueError`` if malformed."""
+        if not isinstance(data, dict):
+            raise ValueError("expected a JSON object")
+        missing = [key for key in ("query", "output") if not data.get(key)]
+        if missing:
+            raise ValueError(f"missing required keys: {', '.join(missing)}")
+        known = {field.name for field in fields(cls)}
+        unknown = sorted(set(data) - known)
+        if unknown:
+            raise ValueError(f"unknown keys: {', '.join(unknown)}")
+        if not all(value is None or isinstance(value, str) for value in data.values()):
+            raise ValueError("all values must be strings")
+        if data.get("model") and data["model"] not in _RESEARCH_MODELS:
+            raise ValueError(f"unknown model: {data['model']} (choose from {', '.join(_RESEARCH_MODELS)})")
+        return cls(**data)
+
+
+async def _consume_stdin(client: AsyncOpenAI, args: argparse.Namespace) -> list[tuple[str, str]]:
+    """Research JSONL records read from stdin on one event loop.
+
+    Each line is a JSON object with ``query`` and ``output`` keys and optional
+    ``context``, ``focus``, ``format`` and ``model`` keys, which default to the
+    command line values; every other setting comes from the command line. A record starts as soon as its line is read,
+    with at most ``--max-concurrency`` records in flight.
+
+    Returns:
+        (output path, research result or error message) for each record, in order
+    """
+
+    sem = asyncio.Semaphore(args.max_concurrency)
+
+    async def _run_one(record: _StdinRecord) -> str:
+        async with sem:
+            return await conduct_research(
+                query=record.query,
+                output_path=record.output,
+                model=record.model or args.model,
+                format_type=record.format or args.format,
+                context=record.context or args.context,
+                focus=record.focus or args.focus,
+                background=not args.sync,
+                enhance_prompt=not args.no_enhance,
+                use_cache=not args.no_cache,
+                semantic_cache=args.semantic_cache,
+                poll_interval=args.poll_interval,
+                poll_max=args.poll_max,
+                poll_timeout=args.poll_timeout,
+                client=client
+            )
+
+    results = []
+    pending = {}
+    line_number = 0
+    while True:
+        line = await asyncio.to_thread(sys.stdin.readline)
+        if not line:
+            break
+        line_number += 1
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            record = _StdinRecord.from_json(_json_loads(line))
+        except ValueError as e:
+            logger.error("❌ Skipping stdin line %s: %s", line_number, e)
+            results.append((f"stdin line {line_number}", f"Error: invalid record: {e}"))
+            continue
+
+        pending[len(results)] = asyncio.create_task(_run_one(record))
+        results.append((record.output, None))
+
+    done = await asyncio.gather(*pending.values(), return_exceptions=True)
+    for index, result in zip(pending, done):
+        if isinstance(result, BaseException):
+            result = f"Error: {result}"
+        results[index] = (results[index][0], result)
+
+    return results
+
+
+@_in_log_session
+async def _run_batch(
+    path_in: str,
+    out_dir: str,
+    model: str = "o4-mini-deep-research",
+    poll_interval: float = 2.0,
+    poll_max: float = 60.0,
+    client: Optional[AsyncOpenAI] = None
+) -> tuple[list[str], list[str]]:
+    """Run many research queries through the OpenAI Batch API.
+
+    Each line of ``path_in`` is a JSON object with a ``query`` key and optional
+    ``id`` (or ``custom_id``), ``context``, ``focus`` and ``format`` keys. Batch jobs are billed at
+    a discount and draw from a separate rate-limit pool, at the cost of a
+    completion window of up to 24 hours.
+
+    Args:
+        path_in: JSONL file with one query per line
+        out_dir: Directory where one markdown file per query is written
+        model: OpenAI model to use
+        poll_interval: Initial delay in seconds between batch status polls
+        poll_max: Upper bound in seconds for the poll delay as it backs off
+        client: OpenAI client to use (defaults to the shared client)
+
+    Returns:
+        The paths of the result files that were written, and the ids of the
+        queries that produced no result
+    """
+
+    items = _load_queries(path_in)
+
+    out_path = Path(out_dir)
+    await asyncio.to_thread(out_path.mkdir, parents=True, exist_ok=True)
+    _, rel_log_path = setup_file_logging(str(out_path / "batch.md"))
+
+    # Build one Responses API request per input line
+    queries = {item["id"]: item["query"] for item in items}
+    request_lines = [
+        _json_dumps({
+            "custom_id": item["id"],
+            "method": "POST",
+            "url": "/v1/responses",
+            "body": {
+                "model": model,
+                "input": _build_basic_query(
+                    item["query"],
+                    item.get("context"),
+                    item.get("focus"),
+                    item.get("format")
+                ),
+                "reasoning": {"summary": "auto"},
+                "tools": _RESEARCH_TOOLS
+            }
+        })
+        for item in items
+    ]
+
+    logger.info("=" * 60)
+    logger.info("🚀 DEEP RESEARCH BATCH STARTED")
+    logger.info("=" * 60)
+    logger.info("📥 Queries: %s from %s", len(request_lines), path_in)
+    logger.info("📁 Results will be saved to: %s", out_dir)
+    logger.info("📋 Log file will be saved to: %s", rel_log_path)
+    logger.info("📝 Using model: %s", model)
+    logger.info("=" * 60)
+
+    if client is None:
+        client = get_client()
+
+    batch_input = await client.files.create(
+        file=("deepresearch_batch.jsonl", b"\n".join(request_lines)),
+        purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_input.id,
+        endpoint="/v1/responses",
+        completion_window="24h"
+    )
+    logger.info("✅ Batch submitted! Batch ID: %s", batch.id)
+    logger.info("⏳ Polling for completion (batches may take up to 24 hours)...")
+
+    interval = poll_interval
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        interval = await _sleep_with_backoff(interval, poll_max)
+        status = batch.status
+        batch = await _poll_batch_once(client, batch.id)
+        if batch.status != status:
+            interval = poll_interval
+        counts = batch.request_counts
+        if counts:
+            logger.info(
+                "⏳ Status: %s (%s/%s done, %s failed)",
+                batch.status, counts.completed, counts.total, counts.failed
+            )
+        else:
+            logger.info("⏳ Status: %s", batch.status)
+
+    if batch.status == "failed":
+        raise RuntimeError(f"Batch {batch.id} ended with status: {batch.status}")
+
+    if batch.status == "completed":
+        logger.info("🎉 Batch completed!")
+    else:
+        # Expired and cancelled batches keep the results of the requests they finished
+        logger.warning("⚠️  Batch %s: saving the results it finished", batch.status)
+
+    if batch.error_file_id:
+        errors = await client.files.content(batch.error_file_id)
+        for line in errors.content.splitlines():
+            if line.strip():
+                entry = _json_loads(line)
+                logger.error("❌ Query %s failed: %s", entry.get('custom_id'), entry.get('error') or entry.get('response'))
+
+    saved = []
+    saved_ids = set()
+    if batch.output_file_id:
+        output = await client.files.content(batch.output_file_id)
+        # Every report of the batch shares one generation timestamp
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            entry = _json_loads(line)
+            custom_id = entry["custom_id"]
+            response = entry.get("response") or {}
+            if entry.get("error") or response.get("status_code") != 200:
+                logger.error("❌ Query %s failed: %s", custom_id, entry.get('error') or response)
+                continue
+
+            body = response["body"]
+            research_result = _extract_output_text(body)
+            cost_info = _calculate_cost(body["usage"], model, _BATCH_PRICE_FACTOR) if body.get("usage") else None
+
+            result_path = out_path / f"{custom_id}.md"
+            async with aiofiles.open(result_path, 'w', encoding='utf-8') as f:
+                await f.write(_format_results(
+                    research_result, queries.get(custom_id, custom_id), model, cost_info, timestamp
+                ))
+            saved.append(str(result_path))
+            saved_ids.add(custom_id)
+            logger.info("💾 Results saved to: %s", result_path)
+
+    logger.info("📊 Saved %s/%s results", len(saved), len(queries))
+    return saved, [custom_id for custom_id in queries if custom_id not in saved_ids]
+
+
+def _extract_output_text(body: dict) -> str:
+    """Concatenate the output text of a raw Responses API JSON body."""
+
+    return "".join(
+        part.get("text", "")
+        for item in body.get("output", [])
+        if item.get("type") == "message"
+        for part in item.get("content", [])
+        if part.get("type") == "output_text"
+    )
+
+
+# Source focus guidance for the built-in query template
+_FOCUS_INSTRUCTIONS: Mapping[str, str] = MappingProxyType({
+    "academic": "Prioritize peer-reviewed research, academic papers, official publications, and scholarly sources.",
+    "business": "Focus on industry reports, market research, financial data, company reports, and business analytics.",
+    "news": "Emphasize recent news articles, press releases, official statements, and current events coverage.",
+    "reports": "Concentrate on official reports, government documents, white papers, and institutional publications.",
+    "technical": "Focus on technical documentation, specifications, standards, and expert technical sources."
+})
+
+_BASIC_REQUIREMENTS = (
+    "Requirements:",
+    "- Include specific figures, trends, statistics, and measurable outcomes",
+    "- Provide inline citations and return all source metadata",
+    "- Be analytical and avoid generalities",
+    "- Use clear, professional language",
+    "- Structure information with appropriate headers and formatting"
+)
+
+
+def _build_basic_query(query: str, context: Optional[str], focus: Optional[str], format_type: Optional[str]) -> str:
+    """Build a basic enhanced query without using prompt enhancement."""
 
     source_instruction = "Include reliable, up-to-date sources with inline citations."
-    if focus and focus.lower() in focus_instructions:
-        source_instruction = focus_instructions[focus.lower()]
+    focus_key = focus.lower() if focus else None
+    if focus_key in _FOCUS_INSTRUCTIONS:
+        source_instruction = _FOCUS_INSTRUCTIONS[focus_key]
     elif focus:
         source_instruction = f"Prioritize sources related to: {focus}. Include inline citations."
 
-    parts.append(f"Source Requirements: {source_instruction}")
+    labelled = (
+        ("Research Query", query),
+        ("Background Context", context),
+        ("Source Requirements", source_instruction),
+        ("Output Format", format_type)
+    )
+    parts = [f"{label}: {value}" for label, value in labelled if value]
 
-    if format_type:
-        parts.append(f"Output Format: {format_type}")
-
-    parts.extend([
-        "Requirements:",
-        "- Include specific figures, trends, statistics, and measurable outcomes",
-        "- Provide inline citations and return all source metadata",
-        "- Be analytical and avoid generalities",
-        "- Use clear, professional language",
-        "- Structure information with appropriate headers and formatting"
-    ])
-
-    return "\n\n".join(parts)
-
-
-def _calculate_cost(usage_data: dict, model: str) -> dict:
-    """Calculate cost based on token usage and model pricing."""
-
-    # 2025 API Pricing (per million tokens)
-    pricing = {
-        "o3-deep-research": {
-            "input": 10.00,
-            "cached_input": 2.50,
-            "output": 40.00
-        },
-        "o4-mini-deep-research": {
-            "input": 2.00,
-            "cached_input": 0.50,
-            "output": 8.00
-        },
-        "gpt-5-mini": {
-            "input": 0.25,
-            "cached_input": 0.025,
-            "output": 2.00
-        }
-    }
+    return "\n\n".join((*parts, *_BASIC_REQUIREMENTS))
+
+
+# 2025 API Pricing in dollars per million tokens: (input, cached input, output)
+_PRICING: dict[str, tuple[float, float, float]] = {
+    "o3-deep-research": (10.00, 2.50, 40.00),
+    "o4-mini-deep-research": (2.00, 0.50, 8.00),
+    "gpt-5-mini": (0.25, 0.025, 2.00),
+}
+
+# Batch API requests are billed at half the list prices
+_BATCH_PRICE_FACTOR = 0.5
+
+
+def _usage_field(usage, name: str):
+    """Read ``name`` from an SDK usage object or a usage dict (None if absent)."""
+    if isinstance(usage, dict):
+        return usage.get(name)
+    return getattr(usage, name, None)
 
-    if model not in pricing:
+
+def _calculate_cost(usage_data, model: str, price_factor: float = 1.0) -> dict:
+    """Calculate cost based on token usage and model pricing.
+
+    ``usage_data`` is either the SDK usage object or its JSON dict (as found
+    in batch results); Responses and Chat Completions field names both work.
+    ``price_factor`` scales the list prices, e.g. ``_BATCH_PRICE_FACTOR``.
+    """
+
+    if model not in _PRICING:
         return {"error": f"Pricing not available for model: {model}"}
 
-    model_pricing = pricing[model]
+    input_price, cached_price, output_price = (price * price_factor for price in _PRICING[model])
 
     # Extract token counts from usage data
-    input_tokens = usage_data.get("prompt_tokens", 0) or usage_data.get("input_tokens", 0)
-    output_tokens = usage_data.get("completion_tokens", 0) or usage_data.get("output_tokens", 0)
-    cached_tokens = usage_data.get("prompt_tokens_details", {}).get("cached_tokens", 0)
-    total_tokens = usage_data.get("total_tokens", input_tokens + output_tokens)
+    input_tokens = _usage_field(usage_data, "input_tokens") or _usage_field(usage_data, "prompt_tokens") or 0
+    output_tokens = _usage_field(usage_data, "output_tokens") or _usage_field(usage_data, "completion_tokens") or 0
+    details = _usage_field(usage_data, "input_tokens_details") or _usage_field(usage_data, "prompt_tokens_details")
+    cached_tokens = (_usage_field(details, "cached_tokens") if details else 0) or 0
+    total_tokens = _usage_field(usage_data, "total_tokens") or input_tokens + output_tokens
 
     # Calculate costs (convert to dollars from per-million pricing)
-    input_cost = (input_tokens - cached_tokens) * model_pricing["input"] / 1_000_000
-    cached_cost = cached_tokens * model_pricing["cached_input"] / 1_000_000 if cached_tokens else 0
-    output_cost = output_tokens * model_pricing["output"] / 1_000_000
+    input_cost = (input_tokens - cached_tokens) * input_price / 1_000_000
+    cached_cost = cached_tokens * cached_price / 1_000_000
+    output_cost = output_tokens * output_price / 1_000_000
     total_cost = input_cost + cached_cost + output_cost
 
     return {
@@ -425,29 +1642,29 @@ def _calculate_cost(usage_data: dict, model: str) -> dict:
     }
 
 
-def _format_results(content: str, query: str, model: str, cost_info: dict = None) -> str:
-    """Format the research results with metadata."""
+_RESULT_FOOTER = """
+
+---
+
+*Generated using OpenAI Deep Research via deepresearch-cli*
+"""
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    # Build cost information section
-    cost_section = ""
-    if cost_info and "error" not in cost_info:
-        cost_section = f"""
+_COST_TEMPLATE = """
 
 ## Token Usage & Cost
 
-**Input Tokens:** {cost_info['input_tokens']:,}
-**Cached Tokens:** {cost_info['cached_tokens']:,}
-**Output Tokens:** {cost_info['output_tokens']:,}
-**Total Tokens:** {cost_info['total_tokens']:,}
+**Input Tokens:** {input_tokens:,}
+**Cached Tokens:** {cached_tokens:,}
+**Output Tokens:** {output_tokens:,}
+**Total Tokens:** {total_tokens:,}
 
-**Input Cost:** ${cost_info['input_cost']:.4f}
-**Cached Cost:** ${cost_info['cached_cost']:.4f}
-**Output Cost:** ${cost_info['output_cost']:.4f}
-**Total Cost:** ${cost_info['total_cost']:.4f}"""
+**Input Cost:** ${input_cost:.4f}
+**Cached Cost:** ${cached_cost:.4f}
+**Output Cost:** ${output_cost:.4f}
+**Total Cost:** ${total_cost:.4f}"""
 
-    return f"""# Deep Research Results
+_RESULT_TEMPLATE = """# Deep Research Results
 
 **Query:** {query}
 **Generated:** {timestamp}
@@ -456,21 +1673,65 @@ def _format_results(content: str, query: str, model: str, cost_info: dict = None
 
 ---
 
-{content}
+"""
 
----
 
-*Generated using OpenAI Deep Research via deepresearch-cli*
-"""
+def _format_cost_section(cost_info: dict = None) -> str:
+    """Format the token usage and cost section, or nothing if unavailable."""
 
+    if not cost_info or "error" in cost_info:
+        return ""
 
-def main():
-    """Main CLI entry point."""
+    return _COST_TEMPLATE.format(**cost_info)
 
-    parser = argparse.ArgumentParser(
-        description="Deep Research CLI - Comprehensive research using OpenAI's Deep Research API",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+
+def _format_header(
+    query: str,
+    model: str,
+    cost_section: str = "",
+    timestamp: Optional[str] = None
+) -> str:
+    """Format the metadata header that precedes the research content.
+
+    ``timestamp`` defaults to the current time; callers formatting many
+    reports can compute it once and pass it in.
+    """
+
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    return _RESULT_TEMPLATE.format(
+        query=query, timestamp=timestamp, model=model, cost_section=cost_section
+    )
+
+
+def _format_results(
+    content: str,
+    query: str,
+    model: str,
+    cost_info: dict = None,
+    timestamp: Optional[str] = None
+) -> str:
+    """Format the research results with metadata."""
+
+    header = _format_header(query, model, _format_cost_section(cost_info), timestamp)
+    return header + content + _RESULT_FOOTER
+
+
+def _report_many(results: list[tuple[str, str]]) -> None:
+    """Print a summary of a multi-query run and exit non-zero if any failed."""
+
+    failed = [
+        label for label, result in results
+        if result.startswith("Error:")
+    ]
+    print(f"✅ {len(results) - len(failed)}/{len(results)} research queries completed")
+    if failed:
+        print(f"❌ Failed: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+
+_EPILOG = """
 Examples:
   deepresearch "Latest AI breakthroughs in 2024" -o research.md
   deepresearch "Climate change impacts" -o climate.md --format "executive summary"
@@ -482,6 +1743,14 @@ Advanced Examples:
   deepresearch "Tech startup landscape" -o startups.md --context "VC research" --focus "business reports"
   deepresearch "AI regulation updates" -o regulation.md --focus news --no-enhance
 
+Batch Examples:
+  deepresearch --batch-file queries.jsonl -o results/
+  deepresearch --queries-file queries.jsonl -o results/ --max-concurrency 4
+  generate_queries | deepresearch --stdin --focus academic
+
+Resuming:
+  deepresearch --resume resp_abc123          # after Ctrl-C, using the recorded output path
+
 Environment Variables:
   OPENAI_API_KEY    Required: Your OpenAI API key
 
@@ -497,23 +1766,65 @@ Focus Options:
   technical   Technical documentation and specifications
   [custom]    Any custom focus description
 """
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once per process)."""
+
+    parser = argparse.ArgumentParser(
+        description="Deep Research CLI - Comprehensive research using OpenAI's Deep Research API",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
 
-    parser.add_argument(
+    # Where the queries come from: exactly one of these is required
+    source = parser.add_mutually_exclusive_group()
+
+    source.add_argument(
         "query",
+        nargs="?",
         help="The research question or topic to investigate"
     )
 
     parser.add_argument(
         "-o", "--output",
-        required=True,
-        help="Output file path (e.g., research_results.md)"
+        help="Output file path (e.g., research_results.md), or output directory with --batch-file"
+    )
+
+    source.add_argument(
+        "--batch-file",
+        help="JSONL file of queries to run through the OpenAI Batch API (one {\"query\": ...} object per line)"
+    )
+
+    source.add_argument(
+        "--queries-file",
+        help="JSONL file of queries to research concurrently (same format as --batch-file)"
+    )
+
+    source.add_argument(
+        "--resume",
+        metavar="ID",
+        help="Resume polling an interrupted background research job and save its results"
+    )
+
+    source.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Read JSONL research records ({\"query\": ..., \"output\": ...}) from stdin"
+    )
+
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of concurrent research jobs with --queries-file or --stdin (default: 8)"
     )
 
     parser.add_argument(
         "--model",
         default="o4-mini-deep-research",
-        choices=["o3-deep-research", "o4-mini-deep-research"],
+        choices=_RESEARCH_MODELS,
         help="OpenAI model to use (default: o4-mini-deep-research)"
     )
 
@@ -544,36 +1855,185 @@ Focus Options:
         help="Disable prompt enhancement with intermediate model (faster but less optimized)"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the API instead of reusing cached prompt enhancements and research results"
+    )
+
+    parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help="Also reuse cached results of similar earlier queries (embeds queries without an exact match)"
+    )
+
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=2.0,
+        help="Initial delay in seconds between background status polls (default: 2)"
+    )
+
+    parser.add_argument(
+        "--poll-max",
+        type=float,
+        default=60.0,
+        help="Maximum delay in seconds between background status polls (default: 60)"
+    )
+
+    parser.add_argument(
+        "--poll-timeout",
+        type=float,
+        default=3600.0,
+        help="Maximum seconds to wait for background research before giving up; the job can then be resumed with --resume (default: 3600, 0 for no limit)"
+    )
+
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
         help="Enable verbose logging"
     )
 
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+
+    parser = _build_parser()
     args = parser.parse_args()
 
+    pending = None
+    if args.resume:
+        pending = _find_pending(args.resume)
+        if not args.output:
+            if not pending:
+                parser.error(f"no pending job recorded for {args.resume}; pass -o/--output")
+            args.output = pending["output_path"]
+
+    if not args.output and not args.stdin:
+        parser.error("the following arguments are required: -o/--output")
+    if not (args.query or args.batch_file or args.queries_file or args.stdin or args.resume):
+        parser.error("the following arguments are required: query")
+    if args.max_concurrency < 1:
+        parser.error("--max-concurrency must be at least 1")
+    if args.poll_interval <= 0:
+        parser.error("--poll-interval must be greater than 0")
+    if args.poll_max < args.poll_interval:
+        parser.error("--poll-max must be at least --poll-interval")
+    if args.poll_timeout < 0:
+        parser.error("--poll-timeout must be 0 (no limit) or greater")
+
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Validate OPENAI_API_KEY
-    if not os.getenv("OPENAI_API_KEY"):
+    # Validate OPENAI_API_KEY once for the whole run
+    try:
+        config = get_config()
+    except ValueError:
         print("❌ Error: OPENAI_API_KEY environment variable is required", file=sys.stderr)
         print("\nSet your OpenAI API key:")
         print("  export OPENAI_API_KEY=your-key-here")
         sys.exit(1)
+    client = _get_async_client(config.openai_api_key)
+
+    if args.batch_file:
+        try:
+            saved, failed = _run(
+                _run_batch(
+                    path_in=args.batch_file,
+                    out_dir=args.output,
+                    model=args.model,
+                    poll_interval=args.poll_interval,
+                    poll_max=args.poll_max,
+                    client=client
+                )
+            )
+            print(f"✅ Batch completed: {len(saved)}/{len(saved) + len(failed)} results saved to {args.output}")
+        except KeyboardInterrupt:
+            print("\n🛑 Batch polling interrupted by user (the batch keeps running on OpenAI)", file=sys.stderr)
+            sys.exit(130)
+        except Exception as e:
+            print(f"❌ Batch error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if failed:
+            print(f"❌ Failed: {', '.join(failed)}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if args.queries_file:
+        try:
+            queries = _load_queries(args.queries_file)
+            results = _run(
+                _run_many(
+                    queries,
+                    out_dir=args.output,
+                    max_concurrency=args.max_concurrency,
+                    client=client,
+                    format_type=args.format,
+                    context=args.context,
+                    focus=args.focus,
+                    model=args.model,
+                    background=not args.sync,
+                    enhance_prompt=not args.no_enhance,
+                    use_cache=not args.no_cache,
+                    semantic_cache=args.semantic_cache,
+                    poll_interval=args.poll_interval,
+                    poll_max=args.poll_max,
+                    poll_timeout=args.poll_timeout
+                )
+            )
+        except KeyboardInterrupt:
+            print("\n🛑 Research interrupted by user", file=sys.stderr)
+            _print_resume_hint()
+            sys.exit(130)
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        print(f"📄 Results saved to: {args.output}")
+        _report_many([(item["id"], result) for item, result in zip(queries, results)])
+        return
+
+    if args.stdin:
+        try:
+            results = _run(_consume_stdin(client, args))
+        except KeyboardInterrupt:
+            print("\n🛑 Research interrupted by user", file=sys.stderr)
+            _print_resume_hint()
+            sys.exit(130)
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        _report_many(results)
+        return
+
+    query, model = args.query, args.model
+    if args.resume:
+        # Use the recorded query and model for the results header when known
+        query = pending["query"] if pending else args.resume
+        model = pending["model"] if pending else args.model
 
     # Run the research
     try:
-        result = asyncio.run(
+        result = _run(
             conduct_research(
-                query=args.query,
+                query=query,
                 output_path=args.output,
-                model=args.model,
+                model=model,
                 format_type=args.format,
                 context=args.context,
                 focus=args.focus,
                 background=not args.sync,
-                enhance_prompt=not args.no_enhance
+                enhance_prompt=not args.no_enhance,
+                use_cache=not args.no_cache,
+                semantic_cache=args.semantic_cache,
+                poll_interval=args.poll_interval,
+                poll_max=args.poll_max,
+                poll_timeout=args.poll_timeout,
+                client=client,
+                resume_id=args.resume
             )
         )
 
@@ -593,6 +2053,7 @@ Focus Options:
 
     except KeyboardInterrupt:
         print("\n🛑 Research interrupted by user", file=sys.stderr)
+        _print_resume_hint()
         sys.exit(130)
     except Exception as e:
         print(f"❌ Unexpected error: {e}", file=sys.stderr)